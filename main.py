@@ -14,13 +14,17 @@ from __future__ import annotations
 
 import argparse
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
+from typing import Optional
 
 import schedule
 
 from src.config import BotConfig
-from src.utils import setup_logger
+from src.utils import setup_logger, count_lines
 from src.storage import HistoryManager
 from src.crawler import SobranieCrawler
 from src.parser import SobranieParser
@@ -42,10 +46,39 @@ class SobranieBot:
         self.parser = SobranieParser()
         self.history = HistoryManager(self.config.HISTORY_FILE)
 
+        # The parser keeps per-document state, so sessions processed in
+        # parallel take turns parsing
+        self._parse_lock = threading.Lock()
+
         # Ensure directories exist
         self.config.RAW_DIR.mkdir(parents=True, exist_ok=True)
         self.config.PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
+    def _download_document(self, found_file: tuple[str, dict]) -> Optional[Path]:
+        """
+        Download a single stenograph document.
+
+        Args:
+            found_file: Tuple of (download_url, parsed_info_dict)
+
+        Returns:
+            Path of the downloaded file, or None on failure
+        """
+        pdf_url, pdf_info = found_file
+        self.logger.info(f"  Found document: {pdf_info['filename']}")
+
+        # Determine initial output path
+        pdf_path = self.config.RAW_DIR / pdf_info["filename"]
+
+        # Download the file
+        download_success, actual_path = self.crawler.download_pdf(pdf_url, pdf_path)
+
+        if not download_success or actual_path is None:
+            self.logger.error(f"Failed to download {pdf_info['filename']}")
+            return None
+
+        return actual_path
+
     def process_session(self, session: dict) -> bool:
         """
         Process a single session: download ALL matching PDFs and parse them.
@@ -68,19 +101,15 @@ class SobranieBot:
             self.logger.warning(f"No PDFs found for session {sitting_id}")
             return False
 
-        success_count = 0
-
-        for pdf_url, pdf_info in found_files:
-            self.logger.info(f"  Found document: {pdf_info['filename']}")
+        # Downloads are network-bound, so fetch all documents concurrently.
+        # Parsing stays sequential: the parser keeps per-document state.
+        with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT_DOWNLOADS) as executor:
+            downloaded = list(executor.map(self._download_document, found_files))
 
-            # Determine initial output path
-            pdf_path = self.config.RAW_DIR / pdf_info["filename"]
-
-            # Download the file
-            download_success, actual_path = self.crawler.download_pdf(pdf_url, pdf_path)
+        success_count = 0
 
-            if not download_success or actual_path is None:
-                self.logger.error(f"Failed to download {pdf_info['filename']}")
+        for actual_path in downloaded:
+            if actual_path is None:
                 continue
 
             # Only parse PDF files
@@ -92,8 +121,16 @@ class SobranieBot:
             jsonl_filename = actual_path.stem + ".jsonl"
             jsonl_path = self.config.PROCESSED_DIR / jsonl_filename
 
+            # Reuse JSONL output that is newer than its source PDF
+            if jsonl_path.exists() and jsonl_path.stat().st_mtime >= actual_path.stat().st_mtime:
+                speech_count = count_lines(jsonl_path)
+                self.logger.info(f"  ↻ Reused {speech_count} parsed speeches from {jsonl_path.name}")
+                success_count += 1
+                continue
+
             try:
-                speech_count = self.parser.parse_to_jsonl(actual_path, jsonl_path)
+                with self._parse_lock:
+                    speech_count = self.parser.parse_to_jsonl(actual_path, jsonl_path)
                 self.logger.info(f"  ✓ Parsed {speech_count} speeches from {actual_path.name}")
                 success_count += 1
 
@@ -102,7 +139,8 @@ class SobranieBot:
 
         if success_count > 0:
             # Mark the session as processed in history
-            self.history.mark_processed(sitting_id, {
+            self.history.mark_processed_deferred(sitting_id, {
+                "status": session.get("status"),
                 "files_processed": success_count,
                 "total_files_found": len(found_files),
                 "last_processed": datetime.now().isoformat()
@@ -121,7 +159,6 @@ class SobranieBot:
         """
         self.logger.info("=" * 70)
         self.logger.info("SOBRANIE BOT - Starting run")
-        self.logger.info(f"Time: {datetime.now().isoformat()}")
         self.logger.info("=" * 70)
 
         stats = {
@@ -136,7 +173,9 @@ class SobranieBot:
         sessions = self.crawler.get_finished_sessions()
         stats["sessions_found"] = len(sessions)
 
-        # Process new sessions
+        # Filter out sessions processed in earlier runs before any details page
+        # is opened, so a run only costs as much as the number of new sessions
+        new_sessions = []
         for session in sessions:
             sitting_id = session["sitting_id"]
 
@@ -145,12 +184,37 @@ class SobranieBot:
                 self.logger.debug(f"Skipping already processed: {sitting_id}")
                 continue
 
-            stats["sessions_new"] += 1
+            new_sessions.append(session)
+
+        stats["sessions_new"] = len(new_sessions)
+        self.logger.info(
+            f"{len(new_sessions)} new of {len(sessions)} sessions "
+            f"({len(sessions) - len(new_sessions)} already processed)"
+        )
 
-            if self.process_session(session):
-                stats["sessions_processed"] += 1
-            else:
-                stats["sessions_failed"] += 1
+        # Process new sessions in parallel (crawling and downloading is I/O-bound).
+        # History is written once at the end, even if the run crashes.
+        try:
+            with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT_SESSIONS) as executor:
+                futures = {
+                    executor.submit(self.process_session, session): session["sitting_id"]
+                    for session in new_sessions
+                }
+
+                for future in as_completed(futures):
+                    try:
+                        processed = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Session {futures[future]} failed with error: {e}")
+                        processed = False
+
+                    if processed:
+                        stats["sessions_processed"] += 1
+                    else:
+                        stats["sessions_failed"] += 1
+        finally:
+            self.history.flush()
+            self.crawler.close()
 
         stats["finished_at"] = datetime.now().isoformat()
 
@@ -165,12 +229,19 @@ class SobranieBot:
         return stats
 
 
-def job():
-    """The scheduled job function."""
+def job(clear_cache: bool = False):
+    """
+    The scheduled job function.
+
+    Args:
+        clear_cache: Drop crawler caches before running
+    """
     logger = setup_logger()
     logger.info("Scheduled job triggered")
     try:
         bot = SobranieBot()
+        if clear_cache:
+            bot.crawler.clear_cache()
         bot.run()
     except Exception as e:
         logger.error(f"Job failed with error: {e}")
@@ -189,12 +260,18 @@ def main():
     parser.add_argument(
         "--schedule-day",
         default="friday",
+        choices=("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"),
         help="Day to run scheduled job (default: friday)"
     )
     parser.add_argument(
         "--schedule-time",
         default="18:00",
-        help="Time to run scheduled job (default: 18:00)"
+        help="Time to run scheduled job, HH:MM or HH:MM:SS (default: 18:00)"
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Clear cached document lists before the first run"
     )
     parser.add_argument(
         "-v", "--verbose",
@@ -204,6 +281,13 @@ def main():
 
     args = parser.parse_args()
 
+    # Validate schedule time before the initial run, so a typo fails fast.
+    # A throwaway scheduler accepts exactly what the real one will.
+    try:
+        getattr(schedule.Scheduler().every(), args.schedule_day).at(args.schedule_time)
+    except schedule.ScheduleValueError as e:
+        parser.error(f"invalid --schedule-time '{args.schedule_time}': {e}")
+
     # Setup logger
     log_level = logging.DEBUG if args.verbose else logging.INFO
     logger = setup_logger(
@@ -213,7 +297,7 @@ def main():
 
     # Run immediately once
     logger.info("Running initial job...")
-    job()
+    job(clear_cache=args.clear_cache)
 
     if args.once:
         logger.info("--once flag set, exiting after single run")
@@ -228,8 +312,14 @@ def main():
 
     try:
         while True:
+            # Sleep until the next job is due instead of polling every minute.
+            # Capped so Ctrl+C stays responsive on every platform.
+            idle = schedule.idle_seconds()
+            if idle is None:
+                time.sleep(60)
+            elif idle > 0:
+                time.sleep(min(idle, 3600))
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
 
@@ -16,17 +16,37 @@ class BotConfig:
     # API endpoint for sessions (discovered from the Angular app)
     SESSIONS_API_URL = "https://api.sobranie.mk"
 
+    # Full URL of the XHR that feeds the Angular sessions list (copy it from
+    # the browser's network tab). When set, sessions are read from its JSON
+    # without starting a browser; None keeps the Selenium path only.
+    SESSIONS_JSON_URL = None
+
+    # Same for the XHR behind a session details page, with a {sitting_id}
+    # placeholder; its JSON carries the item with its Documents list.
+    DETAILS_JSON_URL = None
+
     # Use absolute paths based on project root
     DATA_DIR = PROJECT_ROOT / "data"
     RAW_DIR = DATA_DIR / "raw"
     PROCESSED_DIR = DATA_DIR / "processed"
     HISTORY_FILE = DATA_DIR / "history.json"
+    DETAILS_CACHE_FILE = DATA_DIR / "details_cache.json"
+    DOWNLOAD_MANIFEST_FILE = DATA_DIR / "downloads.json"
     LOG_FILE = PROJECT_ROOT / "sobranie_bot.log"
 
     REQUEST_TIMEOUT = 60
+    DOWNLOAD_TIMEOUT = 120
     REQUEST_DELAY = 1.0
+    MAX_CONCURRENT_SESSIONS = 4  # Parallel sessions (each one opens a browser)
+    MAX_CONCURRENT_DOWNLOADS = 4  # Parallel document downloads per session
+    DRIVER_POOL_SIZE = 4  # Headless Chrome instances shared by parallel sessions
+    HTTP_POOL_SIZE = 20  # Keep-alive connections per host (>= sessions x downloads)
+    CA_BUNDLE = None  # Path to a CA bundle for TLS verification (defaults to certifi)
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+    # Cached document lists are reused for this long (seconds)
+    DETAILS_CACHE_TTL = 24 * 60 * 60
+
     # Pagination settings
     MAX_PAGES_TO_SCRAPE = 10  # Maximum pages to scrape (safety limit)
 
@@ -42,4 +62,7 @@ class ParserConfig:
     Y_TOLERANCE = 4.0
     DENSITY_MAP_RESOLUTION = 1.0
     COLUMN_MARGIN = 5.0
-    FOOTER_ZONE_RATIO = 0.05
\ No newline at end of file
+    FOOTER_ZONE_RATIO = 0.05
+    USE_PYMUPDF = True  # Extract words with PyMuPDF when installed
+    PARSE_WORKERS = 4  # Processes running pdfplumber page layout in parallel (1 disables)
+    MIN_PAGES_PER_WORKER = 25  # Smaller PDFs are not worth starting workers for
\ No newline at end of file
@@ -4,7 +4,12 @@ Web crawler for the Macedonian Parliament website.
 
 from __future__ import annotations
 
+import os
+import queue
 import re
+import shutil
+import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Optional
@@ -25,14 +30,32 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
+import certifi
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
 
 from .config import BotConfig
+from .storage import DetailsCache, DownloadManifest
 from .utils import get_logger, parse_pdf_link_text, generate_fallback_filename
 
 logger = get_logger()
 
+# Patterns used inside per-row/per-link loops
+_XPATH_SESSION_ROWS = etree.XPath(
+    "//*[self::div or self::tr]"
+    "[contains(@class, 'row') or contains(@class, 'ng-scope')]"
+)
+_XPATH_DETAILS_LINK = etree.XPath(".//a[contains(@href, 'detali-na-sednica')]")
+_RE_STENO_ROW = re.compile(r"DocumentTypeId\s*==\s*['\"]?57")
+_RE_STENO_KEYWORD = re.compile(r'[Сс]тенографски|[Сс]тенограм')
+_RE_URL_PARAM = re.compile(r'url=([^&]+)')
+_RE_STATUS = re.compile(r'Завршена|Затворена')
+
+# Status substrings of finished/closed sessions (casefolded)
+_VALID_STATUS_TOKENS = ("завршена", "затворена")
+
 
 class SobranieCrawler:
     """
@@ -44,6 +67,19 @@ class SobranieCrawler:
     - Properly handles PDF files disguised as DOC files
     """
 
+    # Images, styles, fonts and trackers blocked in Chrome via CDP
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico",
+        "*.css", "*.woff", "*.woff2", "*.ttf",
+        "*google-analytics*", "*googletagmanager*", "*facebook*"
+    ]
+
+    # Download extensions implied by an unambiguous Content-Type
+    CONTENT_TYPE_SUFFIXES = {
+        "application/pdf": ".pdf",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx"
+    }
+
     def __init__(self, config: Optional[BotConfig] = None):
         """
         Initialize the crawler.
@@ -65,20 +101,112 @@ class SobranieCrawler:
         self.chrome_options.add_argument("--allow-running-insecure-content")
         self.chrome_options.add_argument(f"user-agent={self.config.USER_AGENT}")
         self.chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        self.chrome_options.add_argument("--blink-settings=imagesEnabled=false")
         self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         self.chrome_options.add_experimental_option("useAutomationExtension", False)
 
-        # Session for direct downloads
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.config.USER_AGENT})
+        # ChromeDriver is installed once; up to DRIVER_POOL_SIZE Chrome
+        # instances are started on demand and reused for every page
+        self._service: Optional[Service] = None
+        self._service_lock = threading.Lock()
+        self._idle_drivers: queue.LifoQueue = queue.LifoQueue()
+        self._driver_slots = threading.BoundedSemaphore(self.config.DRIVER_POOL_SIZE)
+
+        # Session for direct downloads (keep-alive connection pool + retries)
+        self.session = self._configure_session(requests.Session())
+
+        # Document lists of details pages seen in earlier runs
+        self.details_cache = DetailsCache(
+            self.config.DETAILS_CACHE_FILE, self.config.DETAILS_CACHE_TTL
+        )
+
+        # Validators of earlier downloads, used to skip unchanged files
+        self.download_manifest = DownloadManifest(self.config.DOWNLOAD_MANIFEST_FILE)
+
+    def _configure_session(self, session: requests.Session) -> requests.Session:
+        """Set headers, TLS verification, connection pool and retries on an HTTP session."""
+        session.headers.update({"User-Agent": self.config.USER_AGENT})
+        # Verified connections can resume TLS sessions across keep-alive reconnects
+        session.verify = self.config.CA_BUNDLE or certifi.where()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.HTTP_POOL_SIZE,
+            pool_maxsize=self.config.HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504)
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def clear_cache(self) -> None:
+        """Drop cached document lists."""
+        self.details_cache.clear()
+        logger.info("✓ Cleared document list cache")
 
     def _create_driver(self) -> webdriver.Chrome:
         """Create a new Chrome WebDriver instance."""
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=self.chrome_options)
+        with self._service_lock:
+            if self._service is None:
+                self._service = Service(ChromeDriverManager().install())
+        driver = webdriver.Chrome(service=self._service, options=self.chrome_options)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+        # Don't download resources the crawler never reads (XHRs still load)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.debug(f"Could not block page resources: {e}")
         return driver
 
+    def _acquire_driver(self) -> webdriver.Chrome:
+        """
+        Check out a Chrome driver from the pool, starting one if none is idle.
+
+        Blocks while DRIVER_POOL_SIZE drivers are in use. Every call must be
+        paired with _release_driver().
+        """
+        self._driver_slots.acquire()
+        try:
+            try:
+                return self._idle_drivers.get_nowait()
+            except queue.Empty:
+                return self._create_driver()
+        except Exception:
+            self._driver_slots.release()
+            raise
+
+    def _release_driver(self, driver: webdriver.Chrome) -> None:
+        """Reset a driver for the next page and return it to the pool."""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.stop();")
+            self._idle_drivers.put(driver)
+        except Exception:
+            # Broken driver: drop it so the next page starts a fresh one
+            self._quit_driver(driver)
+        finally:
+            self._driver_slots.release()
+
+    def _quit_driver(self, driver: webdriver.Chrome) -> None:
+        """Quit a driver, ignoring errors."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Shut down all idle Chrome drivers."""
+        while True:
+            try:
+                driver = self._idle_drivers.get_nowait()
+            except queue.Empty:
+                break
+            self._quit_driver(driver)
+
     def _handle_cookie_consent(self, driver: webdriver.Chrome) -> bool:
         """Attempt to dismiss any cookie/GDPR consent banners."""
         cookie_selectors = [
@@ -125,6 +253,17 @@ class SobranieCrawler:
             pass
         return False
 
+    def _wait_for_controllers(self, driver: webdriver.Chrome, timeout: int = 10) -> bool:
+        """Wait until the page has rendered its Angular controller elements."""
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[ng-controller]"))
+            )
+            return True
+        except TimeoutException:
+            logger.debug("No Angular controllers after wait, continuing...")
+            return False
+
     def _wait_for_angular(self, driver: webdriver.Chrome, timeout: int = 15) -> bool:
         """Wait for AngularJS to finish loading."""
         try:
@@ -171,30 +310,82 @@ class SobranieCrawler:
         """Check if status indicates a finished/closed session."""
         if not status:
             return False
-        status_lower = status.lower().strip()
-        return "завршена" in status_lower or "затворена" in status_lower
+        status_folded = status.casefold()
+        return any(token in status_folded for token in _VALID_STATUS_TOKENS)
+
+    def _is_finished_item(self, item: dict) -> bool:
+        """Check if an Angular/JSON sitting item is finished or closed."""
+        status_id = str(item.get("StatusId", item.get("Status", "")))
+        return status_id == "60" or self._is_valid_status(item.get("StatusTitle") or "")
+
+    def _get_finished_sessions_json(self) -> list[dict]:
+        """
+        Get finished/closed sessions from the JSON endpoint behind the sessions list.
+
+        Returns:
+            List of session dictionaries (empty if the endpoint is not
+            configured or fails)
+        """
+        if not self.config.SESSIONS_JSON_URL:
+            return []
+
+        try:
+            response = self.session.get(
+                self.config.SESSIONS_JSON_URL, timeout=self.config.REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Sessions JSON endpoint failed, falling back to Selenium: {e}")
+            return []
+
+        if isinstance(data, dict):
+            data = data.get("Items") or data.get("items") or []
+
+        sessions = []
+        seen_sitting_ids = set()
+        for item in data:
+            if not isinstance(item, dict) or not self._is_finished_item(item):
+                continue
+            sitting_id = str(item.get("Id", ""))
+            if sitting_id and sitting_id not in seen_sitting_ids:
+                seen_sitting_ids.add(sitting_id)
+                sessions.append({
+                    "sitting_id": sitting_id,
+                    "details_url": f"{self.config.BASE_URL}/detali-na-sednica.nspx?sittingId={sitting_id}",
+                    "status": item.get("StatusTitle") or "Завршена",
+                    "number": item.get("Number")
+                })
+        return sessions
 
     def get_finished_sessions(self) -> list[dict]:
         """
         Get finished/closed sessions from Page 1 only (Maintenance Mode).
 
+        Uses the JSON endpoint when configured and falls back to Selenium.
+
         Returns:
             List of session dictionaries
         """
+        sessions = self._get_finished_sessions_json()
+        if sessions:
+            logger.info(f"✓ Total sessions found via JSON endpoint: {len(sessions)}")
+            return sessions
+
         driver = None
         sessions = []
         seen_sitting_ids = set()
 
         try:
             logger.info(f"Opening sessions list: {self.config.SESSIONS_URL}")
-            driver = self._create_driver()
+            driver = self._acquire_driver()
             driver.get(self.config.SESSIONS_URL)
-            time.sleep(3)
+            self._wait_for_controllers(driver)
 
             self._handle_cookie_consent(driver)
             self._wait_for_angular(driver)
             self._scroll_page(driver)
-            time.sleep(2)
+            self._wait_for_angular(driver)
 
             logger.info("Scraping Page 1 (Maintenance Mode)...")
 
@@ -256,22 +447,22 @@ class SobranieCrawler:
             # METHOD 2: Fallback - Parse HTML
             if not sessions:
                 logger.debug("Trying HTML parsing fallback...")
-                html = driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
+                tree = lxml_html.fromstring(driver.page_source)
 
-                for row in soup.find_all(['div', 'tr'], class_=re.compile(r'row|ng-scope')):
-                    row_text = row.get_text()
+                for row in _XPATH_SESSION_ROWS(tree):
+                    row_text = row.text_content()
 
-                    if not ('Завршена' in row_text or 'Затворена' in row_text):
+                    if not _RE_STATUS.search(row_text):
                         continue
 
-                    link = row.find('a', href=re.compile(r'detali-na-sednica'))
-                    if not link:
-                        parent = row.find_parent(['div', 'tr'])
-                        if parent:
-                            link = parent.find('a', href=re.compile(r'detali-na-sednica'))
+                    links = _XPATH_DETAILS_LINK(row)
+                    if not links:
+                        parent = next(row.iterancestors('div', 'tr'), None)
+                        if parent is not None:
+                            links = _XPATH_DETAILS_LINK(parent)
 
-                    if link:
+                    if links:
+                        link = links[0]
                         href = link.get('href', '')
                         if not href.startswith('http'):
                             href = urljoin(self.config.BASE_URL, href)
@@ -294,10 +485,7 @@ class SobranieCrawler:
             logger.debug(traceback.format_exc())
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                self._release_driver(driver)
 
         return sessions
 
@@ -305,6 +493,121 @@ class SobranieCrawler:
         """
         Get ALL stenograph PDF/DOC URLs from a session details page.
 
+        Uses the JSON endpoint when configured and falls back to Selenium.
+        Non-empty results are cached on disk for DETAILS_CACHE_TTL seconds,
+        so re-runs don't open the details page again.
+
+        Args:
+            details_url: URL of the session details page
+
+        Returns:
+            List of tuples: (download_url, parsed_info_dict)
+        """
+        cached = self.details_cache.get(details_url)
+        if cached is not None:
+            logger.info(f"✓ Using {len(cached)} cached stenograph documents for {details_url}")
+            return cached
+
+        found_files = self._get_stenograph_pdf_urls_json(details_url)
+        if not found_files:
+            found_files = self._scrape_stenograph_pdf_urls(details_url)
+        if found_files:
+            self.details_cache.put(details_url, found_files)
+        return found_files
+
+    def _add_steno_documents(
+            self,
+            docs: list[dict],
+            found_files: list[tuple[str, dict]],
+            seen_urls: set[str]
+    ) -> None:
+        """
+        Turn stenograph document records into download entries.
+
+        Args:
+            docs: Document dictionaries with id, title and url keys
+            found_files: List of (download_url, parsed_info_dict) to extend
+            seen_urls: Download URLs already collected
+        """
+        for doc in docs:
+            title = doc.get('title', '')
+            url = doc.get('url', '')
+            doc_id = doc.get('id', '')
+
+            if not url:
+                logger.debug(f"Skipping document with no URL: {title}")
+                continue
+
+            preview_url = f"{self.config.BASE_URL}/preview?id={doc_id}&url={url}&method=GetDocumentContent"
+
+            if preview_url in seen_urls:
+                continue
+            seen_urls.add(preview_url)
+
+            parsed_info = parse_pdf_link_text(title)
+
+            if not parsed_info:
+                parsed_info = generate_fallback_filename(title, doc_id, url)
+            else:
+                if '.doc' in url.lower() and '.docx' not in url.lower():
+                    parsed_info['filename'] = parsed_info['filename'].replace('.pdf', '.doc')
+                elif '.docx' in url.lower():
+                    parsed_info['filename'] = parsed_info['filename'].replace('.pdf', '.docx')
+
+            found_files.append((preview_url, parsed_info))
+            logger.info(f"  ✓ [{len(found_files)}] {parsed_info['filename']}")
+
+    def _get_stenograph_pdf_urls_json(self, details_url: str) -> list[tuple[str, dict]]:
+        """
+        Get stenograph documents from the JSON endpoint behind a details page.
+
+        Args:
+            details_url: URL of the session details page
+
+        Returns:
+            List of tuples: (download_url, parsed_info_dict); empty if the
+            endpoint is not configured, fails, or the session is not finished
+        """
+        sitting_id = self._extract_sitting_id(details_url)
+        if not self.config.DETAILS_JSON_URL or not sitting_id:
+            return []
+
+        try:
+            response = self.session.get(
+                self.config.DETAILS_JSON_URL.format(sitting_id=sitting_id),
+                timeout=self.config.REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            item = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Details JSON endpoint failed, falling back to Selenium: {e}")
+            return []
+
+        if isinstance(item, dict) and isinstance(item.get("Item"), dict):
+            item = item["Item"]
+        if not isinstance(item, dict) or not self._is_finished_item(item):
+            return []
+
+        docs = [
+            {
+                "id": doc.get("Id", ""),
+                "title": doc.get("Title") or doc.get("DocumentTitle") or "",
+                "url": doc.get("Url") or doc.get("DocumentUrl") or ""
+            }
+            for doc in item.get("Documents") or []
+            if str(doc.get("DocumentTypeId")) == "57"
+        ]
+
+        found_files = []
+        if docs:
+            logger.info(f"✓ Found {len(docs)} stenograph documents via JSON endpoint")
+            self._add_steno_documents(docs, found_files, set())
+        return found_files
+
+    def _scrape_stenograph_pdf_urls(self, details_url: str) -> list[tuple[str, dict]]:
+        """
+        Scrape stenograph PDF/DOC URLs from a session details page.
+
         Args:
             details_url: URL of the session details page
 
@@ -317,54 +620,35 @@ class SobranieCrawler:
 
         try:
             logger.info(f"Opening details page: {details_url}")
-            driver = self._create_driver()
+            driver = self._acquire_driver()
             driver.get(details_url)
-            time.sleep(3)
+            self._wait_for_controllers(driver)
 
             self._handle_cookie_consent(driver)
             self._wait_for_angular(driver)
             self._scroll_page(driver)
-            time.sleep(2)
-
-            # Check if session is finished/closed
-            session_status = driver.execute_script("""
-                try {
-                    var controllers = document.querySelectorAll('[ng-controller]');
-                    for (var i = 0; i < controllers.length; i++) {
-                        var scope = angular.element(controllers[i]).scope();
-                        if (scope && scope.item) {
-                            return {
-                                statusId: scope.item.StatusId,
-                                statusTitle: scope.item.StatusTitle || ''
-                            };
-                        }
-                    }
-                    return null;
-                } catch(e) { return null; }
-            """)
-
-            if session_status:
-                status_id = session_status.get('statusId')
-                status_title = session_status.get('statusTitle', '').lower()
-                is_valid = (status_id == 60 or
-                            'завршена' in status_title or
-                            'затворена' in status_title)
-
-                if not is_valid:
-                    logger.info(
-                        f"Session status '{session_status.get('statusTitle')}' is not finished/closed, skipping")
-                    return found_files
+            self._wait_for_angular(driver)
 
-            # METHOD 1: Extract ALL documents from Angular scope
+            # Read the session status and ALL stenograph documents from the
+            # Angular scope in a single script call
+            scope_data = None
             try:
-                all_steno_docs = driver.execute_script("""
+                scope_data = driver.execute_script("""
+                    var status = null;
+                    var allDocs = [];
                     try {
-                        var allDocs = [];
                         var controllers = document.querySelectorAll('[ng-controller]');
 
                         for (var i = 0; i < controllers.length; i++) {
                             var scope = angular.element(controllers[i]).scope();
 
+                            if (!status && scope && scope.item) {
+                                status = {
+                                    StatusId: scope.item.StatusId,
+                                    StatusTitle: scope.item.StatusTitle || ''
+                                };
+                            }
+
                             if (scope && scope.item && scope.item.Documents && scope.item.Documents.length > 0) {
                                 for (var j = 0; j < scope.item.Documents.length; j++) {
                                     var doc = scope.item.Documents[j];
@@ -399,66 +683,84 @@ class SobranieCrawler:
                                 }
                             }
                         }
-                        return allDocs;
                     } catch(e) {
-                        console.error('Angular document extraction error:', e);
-                        return [];
+                        console.error('Angular scope extraction error:', e);
                     }
+                    return {status: status, docs: allDocs};
                 """)
-
-                if all_steno_docs and len(all_steno_docs) > 0:
-                    logger.info(f"✓ Found {len(all_steno_docs)} stenograph documents via Angular scope")
-
-                    for doc in all_steno_docs:
-                        title = doc.get('title', '')
-                        url = doc.get('url', '')
-                        doc_id = doc.get('id', '')
-
-                        if not url:
-                            logger.debug(f"Skipping document with no URL: {title}")
-                            continue
-
-                        preview_url = f"{self.config.BASE_URL}/preview?id={doc_id}&url={url}&method=GetDocumentContent"
-
-                        if preview_url in seen_urls:
-                            continue
-                        seen_urls.add(preview_url)
-
-                        parsed_info = parse_pdf_link_text(title)
-
-                        if not parsed_info:
-                            parsed_info = generate_fallback_filename(title, doc_id, url)
-                        else:
-                            if '.doc' in url.lower() and '.docx' not in url.lower():
-                                parsed_info['filename'] = parsed_info['filename'].replace('.pdf', '.doc')
-                            elif '.docx' in url.lower():
-                                parsed_info['filename'] = parsed_info['filename'].replace('.pdf', '.docx')
-
-                        found_files.append((preview_url, parsed_info))
-                        logger.info(f"  ✓ [{len(found_files)}] {parsed_info['filename']}")
-
             except Exception as e:
                 logger.warning(f"Angular scope extraction failed: {e}")
                 import traceback
                 logger.debug(traceback.format_exc())
 
-            # METHOD 2: Look for ALL "Стенографски" links in rendered HTML
-            try:
-                logger.debug("Scanning HTML for additional stenograph links...")
-                html = driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
+            scope_data = scope_data or {}
+
+            # Check if session is finished/closed
+            session_status = scope_data.get('status')
+            if session_status and not self._is_finished_item(session_status):
+                logger.info(
+                    f"Session status '{session_status.get('StatusTitle')}' is not finished/closed, skipping")
+                return found_files
+
+            # METHOD 1: Documents from the Angular scope
+            all_steno_docs = scope_data.get('docs')
+            if all_steno_docs:
+                logger.info(f"✓ Found {len(all_steno_docs)} stenograph documents via Angular scope")
+                self._add_steno_documents(all_steno_docs, found_files, seen_urls)
+
+            # METHOD 2: Look for ALL "Стенографски" links in rendered HTML.
+            # Skipped when the Angular scope already yielded documents, which
+            # saves serialising the whole DOM through driver.page_source.
+            if not found_files:
+                try:
+                    logger.debug("Scanning HTML for additional stenograph links...")
+                    tree = lxml_html.fromstring(driver.page_source)
+
+                    steno_rows = [
+                        row for row in tree.xpath('//tr[@ng-if]')
+                        if _RE_STENO_ROW.search(row.get('ng-if'))
+                    ]
+
+                    if steno_rows:
+                        logger.debug(f"Found {len(steno_rows)} stenograph table rows in HTML")
 
-                steno_rows = soup.find_all('tr', attrs={'ng-if': re.compile(r"DocumentTypeId\s*==\s*['\"]?57")})
+                        for row in steno_rows:
+                            link = row.find('.//a[@href]')
+                            if link is not None:
+                                link_text = link.text_content().strip()
+                                href = link.get('href', '')
 
-                if steno_rows:
-                    logger.debug(f"Found {len(steno_rows)} stenograph table rows in HTML")
+                                if not href.startswith('http'):
+                                    href = urljoin(self.config.BASE_URL, href)
 
-                    for row in steno_rows:
-                        link = row.find('a', href=True)
-                        if link:
-                            link_text = link.get_text(strip=True)
+                                if href in seen_urls:
+                                    continue
+                                seen_urls.add(href)
+
+                                parsed_info = parse_pdf_link_text(link_text)
+
+                                if parsed_info:
+                                    if 'url=' in href:
+                                        url_match = _RE_URL_PARAM.search(href)
+                                        if url_match:
+                                            actual_url = url_match.group(1)
+                                            if '.doc' in actual_url.lower() and '.docx' not in actual_url.lower():
+                                                parsed_info['filename'] = parsed_info['filename'].replace('.pdf', '.doc')
+                                            elif '.docx' in actual_url.lower():
+                                                parsed_info['filename'] = parsed_info['filename'].replace('.pdf', '.docx')
+
+                                    found_files.append((href, parsed_info))
+                                    logger.info(f"  ✓ [{len(found_files)}] Found via HTML row: {parsed_info['filename']}")
+
+                    # Full-page anchor sweep only when nothing was found so far
+                    if not found_files:
+                        for link in tree.xpath('//a[@href]'):
+                            link_text = link.text_content().strip()
                             href = link.get('href', '')
 
+                            if not _RE_STENO_KEYWORD.search(link_text):
+                                continue
+
                             if not href.startswith('http'):
                                 href = urljoin(self.config.BASE_URL, href)
 
@@ -470,7 +772,7 @@ class SobranieCrawler:
 
                             if parsed_info:
                                 if 'url=' in href:
-                                    url_match = re.search(r'url=([^&]+)', href)
+                                    url_match = _RE_URL_PARAM.search(href)
                                     if url_match:
                                         actual_url = url_match.group(1)
                                         if '.doc' in actual_url.lower() and '.docx' not in actual_url.lower():
@@ -479,42 +781,13 @@ class SobranieCrawler:
                                             parsed_info['filename'] = parsed_info['filename'].replace('.pdf', '.docx')
 
                                 found_files.append((href, parsed_info))
-                                logger.info(f"  ✓ [{len(found_files)}] Found via HTML row: {parsed_info['filename']}")
-
-                for link in soup.find_all('a', href=True):
-                    link_text = link.get_text(strip=True)
-                    href = link.get('href', '')
-
-                    if not re.search(r'[Сс]тенографски|[Сс]тенограм', link_text):
-                        continue
-
-                    if not href.startswith('http'):
-                        href = urljoin(self.config.BASE_URL, href)
+                                logger.info(f"  ✓ [{len(found_files)}] Found via keyword: {parsed_info['filename']}")
 
-                    if href in seen_urls:
-                        continue
-                    seen_urls.add(href)
-
-                    parsed_info = parse_pdf_link_text(link_text)
-
-                    if parsed_info:
-                        if 'url=' in href:
-                            url_match = re.search(r'url=([^&]+)', href)
-                            if url_match:
-                                actual_url = url_match.group(1)
-                                if '.doc' in actual_url.lower() and '.docx' not in actual_url.lower():
-                                    parsed_info['filename'] = parsed_info['filename'].replace('.pdf', '.doc')
-                                elif '.docx' in actual_url.lower():
-                                    parsed_info['filename'] = parsed_info['filename'].replace('.pdf', '.docx')
-
-                        found_files.append((href, parsed_info))
-                        logger.info(f"  ✓ [{len(found_files)}] Found via keyword: {parsed_info['filename']}")
-
-            except Exception as e:
-                logger.warning(f"HTML keyword search failed: {e}")
+                except Exception as e:
+                    logger.warning(f"HTML keyword search failed: {e}")
 
-            # METHOD 3: Use Selenium to find ALL links directly
-            if len(found_files) == 0:
+            # METHOD 3: Use Selenium to find ALL links directly (only if nothing found yet)
+            if not found_files:
                 try:
                     logger.debug("Trying Selenium element search for all document links...")
 
@@ -537,7 +810,7 @@ class SobranieCrawler:
                                     if not href or href in seen_urls:
                                         continue
 
-                                    if re.search(r'[Сс]тенографски|[Сс]тенограм', link_text):
+                                    if _RE_STENO_KEYWORD.search(link_text):
                                         seen_urls.add(href)
                                         parsed_info = parse_pdf_link_text(link_text)
 
@@ -573,64 +846,146 @@ class SobranieCrawler:
             logger.debug(traceback.format_exc())
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                self._release_driver(driver)
 
         return found_files
 
-    def download_pdf(self, pdf_url: str, output_path: Path) -> tuple[bool, Optional[Path]]:
+    def _head_download(self, pdf_url: str, entry: Optional[dict]) -> Optional[requests.Response]:
         """
-        Download file and correct extension based on content.
+        Send a HEAD request for a download URL.
+
+        Adds If-None-Match / If-Modified-Since when the URL was downloaded before.
 
         Args:
             pdf_url: URL to download from
-            output_path: Initial output path
+            entry: Manifest entry of the earlier download, if any
 
         Returns:
-            tuple: (success: bool, actual_path: Path or None)
+            HEAD response, or None if the request failed
         """
-        try:
-            logger.info(f"Downloading: {pdf_url}")
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
 
-            response = self.session.get(
-                pdf_url, stream=True, timeout=120, verify=False, allow_redirects=True
+        try:
+            return self.session.head(
+                pdf_url, headers=headers, timeout=self.config.REQUEST_TIMEOUT,
+                allow_redirects=True
             )
-            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.debug(f"HEAD request failed: {e}")
+            return None
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            temp_path = output_path.with_suffix(".tmp")
+    def _is_unchanged(self, head: requests.Response, entry: dict, local_path: Path) -> bool:
+        """
+        Check whether an earlier download is still current.
 
-            with open(temp_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        Args:
+            head: HEAD response for the download URL
+            entry: Manifest entry of the earlier download
+            local_path: Path of the earlier download
 
-            file_size = temp_path.stat().st_size
-            if file_size < 1000:
-                logger.warning(f"Downloaded file too small: {file_size} bytes")
-                temp_path.unlink()
-                return False, None
+        Returns:
+            True if the server reports the same file
+        """
+        if head.status_code == 304:
+            return True
+        if not head.ok:
+            return False
 
-            is_pdf = False
-            is_docx = False
+        # A validator the server sends decides on its own; a different one means
+        # a new version even if the size happens to match
+        etag = head.headers.get("ETag")
+        if etag:
+            return etag == entry.get("etag")
+        last_modified = head.headers.get("Last-Modified")
+        if last_modified:
+            return last_modified == entry.get("last_modified")
 
-            with open(temp_path, "rb") as f:
-                header = f.read(8)
+        # No validators: fall back to comparing sizes
+        content_length = head.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            return int(content_length) == local_path.stat().st_size
 
-                if header.startswith(b'%PDF'):
-                    is_pdf = True
-                elif header.startswith(b'PK\x03\x04'):
-                    is_docx = True
+        return False
 
-            original_suffix = output_path.suffix.lower()
+    def _detect_suffix(
+            self,
+            pdf_url: str,
+            head: Optional[requests.Response],
+            original_suffix: str
+    ) -> str:
+        """
+        Guess the file extension before downloading the body.
 
-            if is_pdf:
-                correct_suffix = '.pdf'
-            elif is_docx:
-                correct_suffix = '.docx'
-            else:
-                correct_suffix = original_suffix if original_suffix else '.doc'
+        Uses the Content-Type from the HEAD response and, when that is
+        ambiguous, sniffs the magic bytes with a ranged GET. This is only a
+        hint: download_pdf() checks the first bytes of the real body and
+        renames the file if they disagree.
+
+        Args:
+            pdf_url: URL to download from
+            head: HEAD response for the download URL, if any
+            original_suffix: Extension guessed from the link
+
+        Returns:
+            Extension including the dot
+        """
+        if head is not None and head.ok:
+            content_type = head.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            suffix = self.CONTENT_TYPE_SUFFIXES.get(content_type)
+            if suffix:
+                return suffix
+
+        header = b""
+        try:
+            with self.session.get(
+                    pdf_url, headers={"Range": "bytes=0-7"}, stream=True,
+                    timeout=self.config.REQUEST_TIMEOUT, allow_redirects=True
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                header = response.raw.read(8)
+        except requests.RequestException as e:
+            logger.debug(f"Ranged GET failed: {e}")
+
+        return self._suffix_from_header(header) or original_suffix or '.doc'
+
+    @staticmethod
+    def _suffix_from_header(header: bytes) -> Optional[str]:
+        """Return the extension matching a file's magic bytes, or None if unknown."""
+        if header.startswith(b'%PDF'):
+            return '.pdf'
+        if header.startswith(b'PK\x03\x04'):
+            return '.docx'
+        return None
+
+    def download_pdf(self, pdf_url: str, output_path: Path) -> tuple[bool, Optional[Path]]:
+        """
+        Download file and correct extension based on content.
+
+        Args:
+            pdf_url: URL to download from
+            output_path: Initial output path
+
+        Returns:
+            tuple: (success: bool, actual_path: Path or None)
+        """
+        partial_path = None
+        try:
+            entry = self.download_manifest.get(pdf_url)
+            head = self._head_download(pdf_url, entry)
+
+            if entry and head is not None:
+                local_path = output_path.parent / entry["filename"]
+                if local_path.exists() and self._is_unchanged(head, entry, local_path):
+                    logger.info(f"✓ Unchanged since last download: {local_path.name}")
+                    return True, local_path
+
+            original_suffix = output_path.suffix.lower()
+            correct_suffix = self._detect_suffix(pdf_url, head, original_suffix)
 
             if correct_suffix != original_suffix:
                 logger.info(
@@ -639,20 +994,69 @@ class SobranieCrawler:
             else:
                 final_path = output_path
 
-            if final_path.exists():
-                final_path.unlink()
+            logger.info(f"Downloading: {pdf_url}")
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Stream the body to a temp file next to the guessed path in 1 MiB
+            # chunks (unbuffered: copyfileobj already writes large blocks),
+            # keeping the first bytes to check the guess against the real
+            # content. A file from an earlier run stays in place until the new
+            # one is complete.
+            header = b""
+            with self.session.get(
+                    pdf_url, stream=True, timeout=self.config.DOWNLOAD_TIMEOUT,
+                    allow_redirects=True
+            ) as response:
+                response.raise_for_status()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                response.raw.decode_content = True
+                with tempfile.NamedTemporaryFile(
+                        "wb", buffering=0, dir=final_path.parent, suffix=".tmp", delete=False
+                ) as f:
+                    partial_path = Path(f.name)
+                    while len(header) < 8:
+                        chunk = response.raw.read(8 - len(header))
+                        if not chunk:
+                            break
+                        header += chunk
+                    f.write(header)
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+
+            file_size = partial_path.stat().st_size
+            if file_size < 1000:
+                logger.warning(f"Downloaded file too small: {file_size} bytes")
+                partial_path.unlink()
+                return False, None
+
+            # The body decides: e.g. a PDF served with a .doc link and no usable
+            # Content-Type is renamed to .pdf
+            sniffed_suffix = self._suffix_from_header(header)
+            if sniffed_suffix and sniffed_suffix != final_path.suffix:
+                logger.info(
+                    f"Detected {sniffed_suffix.upper()[1:]} content. Correcting extension from {final_path.suffix} to {sniffed_suffix}")
+                final_path = final_path.with_suffix(sniffed_suffix)
+
+            # NamedTemporaryFile creates 0600 files; keep the usual mode
+            os.chmod(partial_path, 0o644)
+            os.replace(partial_path, final_path)
 
-            temp_path.rename(final_path)
+            self.download_manifest.record(pdf_url, {
+                "filename": final_path.name,
+                "size": file_size,
+                "etag": etag,
+                "last_modified": last_modified
+            })
 
             logger.info(f"✓ Downloaded: {final_path.name} ({file_size / 1024:.1f} KB)")
             return True, final_path
 
         except Exception as e:
             logger.error(f"Download failed: {e}")
-            temp_path = output_path.with_suffix(".tmp")
-            if temp_path.exists():
+            if partial_path and partial_path.exists():
                 try:
-                    temp_path.unlink()
+                    partial_path.unlink()
                 except:
                     pass
-            return False, None
\ No newline at end of file
+            return False, None
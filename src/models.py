@@ -8,6 +8,9 @@ import json
 from dataclasses import dataclass
 from typing import Optional, NamedTuple
 
+# Shared encoder (json.dumps builds a new encoder per call for non-default options)
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 class GutterInfo(NamedTuple):
     """Information about detected column gutter."""
@@ -18,7 +21,7 @@ class GutterInfo(NamedTuple):
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Speech:
     """Represents a single speech extracted from stenographic notes."""
     speaker: str
@@ -39,4 +42,4 @@ class Speech:
 
     def to_json(self) -> str:
         """Convert speech to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
\ No newline at end of file
+        return _JSON_ENCODER.encode(self.to_dict())
\ No newline at end of file
@@ -5,49 +5,48 @@ Text cleaning utilities for PDF parsing.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 
 from ..models import Speech
 
+_RE_PAGE_NUMBER = re.compile(r'^\d{1,3}$')
+
 
 class FooterCleaner:
     """Removes archival footer codes while preserving speech numbers."""
 
-    FOOTER_CODE_PATTERNS = [
-        re.compile(r'^\d{1,3}-\d{1,3}/\d{1,3}$'),
-        re.compile(r'^\d{1,3}-\d{1,3}/\d{1,3}\.$'),
-        re.compile(r'^\d{1,3}-\d{1,3}/\d{1,3},$'),
-        re.compile(r'^\d{1,3}/\d{1,3}\.-$'),
-        re.compile(r'^\d{1,3}-\d{1,3}/\d{1,3}\.-$'),
-        re.compile(r'^\d{1,2}/\d{1,3}$'),
-        re.compile(r'^\d{1,2}/\d{1,3}\.$'),
-        re.compile(r'^\d{1,3}\.-$'),
-        re.compile(r'^\d{1,3}-$'),
-    ]
-
-    INLINE_FOOTER_PATTERNS = [
-        re.compile(r'\s+\d{1,3}-\d{1,3}/\d{1,3}[,.]?\s*$'),
-        re.compile(r'\s+\d{1,2}/\d{1,3}\.?\-?\s*$'),
-        re.compile(r'\s+\d{1,3}\.-\s*$'),
-    ]
-
-    @classmethod
-    def is_footer_code(cls, text: str) -> bool:
+    # Footer codes such as "12-3/45", "12-3/45.-", "3/45." or "12.-" in one pattern
+    FOOTER_CODE_RE = re.compile(
+        r'^(?:\d{1,3}-\d{1,3}/\d{1,3}(?:[.,]|\.-)?'
+        r'|\d{1,3}/\d{1,3}\.-'
+        r'|\d{1,2}/\d{1,3}\.?'
+        r'|\d{1,3}\.?-)$'
+    )
+
+    # Trailing footer codes, stripped in one pass. Groups are ordered so that a
+    # "1-2/3" code is removed first, then "1/2.-", then "1.-", like
+    # applying the three patterns one after another.
+    INLINE_FOOTER_RE = re.compile(
+        r'(?:\s+\d{1,3}\.-\s*)?'
+        r'(?:\s+\d{1,2}/\d{1,3}\.?\-?\s*)?'
+        r'(?:\s+\d{1,3}-\d{1,3}/\d{1,3}[,.]?\s*)?$'
+    )
+
+    # Footer codes and page numbers repeat on every page, so results are memoized
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def is_footer_code(text: str) -> bool:
         """Check if text is a footer code."""
-        text = text.strip()
-        if not text:
-            return False
-        for pattern in cls.FOOTER_CODE_PATTERNS:
-            if pattern.match(text):
-                return True
-        return False
+        return FooterCleaner.FOOTER_CODE_RE.match(text.strip()) is not None
 
-    @classmethod
-    def is_page_number_at_bottom(cls, text: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def is_page_number_at_bottom(text: str) -> bool:
         """Check if text is a page number."""
         text = text.strip()
-        if re.match(r'^\d{1,3}$', text):
+        if _RE_PAGE_NUMBER.match(text):
             try:
                 num = int(text)
                 return 1 <= num <= 500
@@ -58,10 +57,7 @@ class FooterCleaner:
     @classmethod
     def clean_text(cls, text: str) -> str:
         """Remove inline footer patterns from text."""
-        cleaned = text
-        for pattern in cls.INLINE_FOOTER_PATTERNS:
-            cleaned = pattern.sub('', cleaned)
-        return cleaned.strip()
+        return cls.INLINE_FOOTER_RE.sub('', text, count=1).strip()
 
 
 @dataclass
@@ -86,19 +82,30 @@ class TextBuffer:
         text = text.strip()
         if not text:
             return
-        if self.text_parts and self.text_parts[-1].endswith("-"):
-            self.text_parts[-1] = self.text_parts[-1][:-1] + text
-        else:
-            self.text_parts.append(text)
+        # Words hyphenated across lines are glued in flush(), so a long run of
+        # hyphenated lines is not copied again on every append
+        self.text_parts.append(text)
         self.current_page = page
 
+    def _joined_parts(self) -> Iterator[str]:
+        """Yield the parts with separators: a space, or nothing after a trailing hyphen."""
+        last = len(self.text_parts) - 1
+        for i, part in enumerate(self.text_parts):
+            if i == last:
+                yield part
+            elif part.endswith("-"):
+                yield part[:-1]
+            else:
+                yield part
+                yield " "
+
     def flush(self) -> Optional[Speech]:
         """Flush buffer and return a Speech object."""
         if not self.has_content():
             self._reset()
             return None
-        merged = " ".join(self.text_parts)
-        merged = re.sub(r"\s+", " ", merged).strip()
+        # split() drops every whitespace run, so this also collapses and strips
+        merged = " ".join("".join(self._joined_parts()).split())
         merged = FooterCleaner.clean_text(merged)
         if not merged:
             self._reset()
@@ -115,7 +122,7 @@ class TextBuffer:
     def _reset(self) -> None:
         """Reset the buffer."""
         self.speaker = ""
-        self.text_parts = []
+        self.text_parts.clear()
         self.start_page = 0
         self.current_page = 0
 
@@ -4,13 +4,22 @@ Core PDF parser for Macedonian Parliament stenographic notes.
 
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import os
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from collections import defaultdict
-from typing import Optional
+from typing import Iterator, Optional
 
 import pdfplumber
-from pdfplumber.page import Page
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
 
 from ..config import ParserConfig
 from ..models import Speech
@@ -20,6 +29,124 @@ from .cleaning import FooterCleaner, TextBuffer
 
 logger = get_logger()
 
+# Patterns used on every line, compiled once
+_RE_DIGIT = re.compile(r'\d')
+# Parenthetical remarks and whitespace, collapsed together into one space
+_RE_PARENTHESES_OR_SPACE = re.compile(r'(?:\([^)]*\)|\s)+')
+_RE_JUNK_LINE = re.compile(r'^[\s\.\,\-\_\(\)/]+$')
+_JUNK_LINE_CHARS = frozenset(".,-_()/")
+
+# Sort keys for word and character dictionaries
+_BY_TOP = itemgetter("top")
+_BY_TOP_X0 = itemgetter("top", "x0")
+_BY_X0 = itemgetter("x0")
+
+# Sentence end followed by "Name Surname:" and the start of a new speech
+_RE_MID_LINE_SPEAKER = re.compile(
+    r'([.?!])\s+'
+    r'([А-ЯЃЅЈЉЊЌЏа-яѓѕјљњќџ][А-ЯЃЅЈЉЊЌЏа-яѓѕјљњќџ\s\-\.]+?)'
+    r'\s*:\s*'
+    r'(.+)$'
+)
+
+# Ligatures expanded by pdfplumber's word extraction
+_LIGATURES = {"ﬀ": "ff", "ﬃ": "ffi", "ﬄ": "ffl", "ﬁ": "fi", "ﬂ": "fl", "ﬆ": "st", "ﬅ": "st"}
+
+
+def _chars_to_words(chars: list[dict], x_tolerance: float, y_tolerance: float) -> Optional[list[dict]]:
+    """
+    Group pdfplumber characters into words.
+
+    Produces the same words as pdfplumber's extract_words() with its default
+    left-to-right, top-to-bottom settings, but only builds the text and
+    bounding box keys the parser uses.
+
+    Args:
+        chars: Characters of a page (page.chars)
+        x_tolerance: Maximum horizontal gap between characters of one word
+        y_tolerance: Maximum vertical distance between characters of one line
+
+    Returns:
+        List of word dictionaries, or None if the page has rotated text
+        (left to pdfplumber)
+    """
+    if not all(char["upright"] for char in chars):
+        return None
+
+    # Cluster tops into lines: sorted distinct tops chain into one line while
+    # each is within y_tolerance of the previous one
+    line_of_top = {}
+    line_index = -1
+    last_top = None
+    for top in sorted(set(map(_BY_TOP, chars))):
+        if last_top is None or top > last_top + y_tolerance:
+            line_index += 1
+        line_of_top[top] = line_index
+        last_top = top
+
+    lines = [[] for _ in range(line_index + 1)]
+    for char in chars:
+        lines[line_of_top[char["top"]]].append(char)
+
+    words = []
+
+    def emit(word_chars: list[dict]) -> None:
+        words.append({
+            "text": "".join(_LIGATURES.get(c["text"], c["text"] or "") for c in word_chars),
+            "x0": min(c["x0"] for c in word_chars),
+            "x1": max(c["x1"] for c in word_chars),
+            "top": min(c["top"] for c in word_chars),
+            "bottom": max(c["bottom"] for c in word_chars)
+        })
+
+    for line_chars in lines:
+        line_chars.sort(key=_BY_X0)
+        current = []
+        for char in line_chars:
+            text = char["text"]
+            if text.isspace():
+                if current:
+                    emit(current)
+                current = []
+            elif not text:
+                # pdfplumber treats empty glyphs as one-character words
+                if current:
+                    emit(current)
+                emit([char])
+                current = []
+            elif current and (
+                    char["x0"] < current[-1]["x0"]
+                    or char["x0"] > current[-1]["x1"] + x_tolerance
+                    or abs(char["top"] - current[-1]["top"]) > y_tolerance
+            ):
+                emit(current)
+                current = [char]
+            else:
+                current.append(char)
+        if current:
+            emit(current)
+    return words
+
+
+class _Stats:
+    """Parser counters, kept as slotted attributes so increments skip dict hashing."""
+
+    __slots__ = (
+        "footer_codes_removed", "page_numbers_removed", "footer_lines_removed",
+        "lines_processed", "total_words", "speakers_found", "speakers_poisoned",
+        "pages_with_gutter", "pages_fallback", "pages_processed",
+        "left_column_words", "right_column_words"
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def merge(self, other: _Stats) -> None:
+        """Add the counters of another instance, e.g. one returned by a worker process."""
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
 
 class SobranieParser:
     """Two-column parser with complete footer cleaning."""
@@ -27,8 +154,12 @@ class SobranieParser:
     CYRILLIC_UPPER_START = 0x0410
     CYRILLIC_UPPER_END = 0x042F
     SPECIAL_MACEDONIAN_UPPER = {0x0403, 0x0405, 0x0408, 0x0409, 0x040A, 0x040C, 0x040F}
+    CYRILLIC_UPPER = frozenset(
+        [chr(code) for code in range(CYRILLIC_UPPER_START, CYRILLIC_UPPER_END + 1)]
+        + [chr(code) for code in SPECIAL_MACEDONIAN_UPPER]
+    )
 
-    POISON_WORDS = {
+    POISON_WORDS = frozenset({
         "следното", "вкупно", "износ", "камата", "транша", "повлекување",
         "отплата", "главница", "денари", "евра", "процент", "година", "години",
         "гласаа", "против", "воздржани", "предлог", "закон", "член",
@@ -36,7 +167,7 @@ class SobranieParser:
         "констатирам", "усвоени", "известени", "поканети", "дека", "собранието",
         "владата", "пратениците", "вели", "вика", "рече", "кажа", "во",
         "овој", "контекст", "еве"
-    }
+    })
 
     def __init__(self, config: Optional[ParserConfig] = None):
         """
@@ -48,13 +179,13 @@ class SobranieParser:
         self.config = config or ParserConfig()
         self.detector = VerticalProjectionDetector(self.config)
         self._buffer = TextBuffer()
-        self._stats = defaultdict(int)
+        self._stats = _Stats()
+        # Hot-path debug messages are skipped entirely unless DEBUG is enabled
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
     def _is_cyrillic_uppercase(self, char: str) -> bool:
         """Check if character is Cyrillic uppercase."""
-        code = ord(char)
-        return (self.CYRILLIC_UPPER_START <= code <= self.CYRILLIC_UPPER_END or
-                code in self.SPECIAL_MACEDONIAN_UPPER)
+        return char in self.CYRILLIC_UPPER
 
     def _is_valid_speaker_name(self, name: str) -> bool:
         """Validate if a string looks like a valid speaker name."""
@@ -66,7 +197,7 @@ class SobranieParser:
             return False
         if not self._is_cyrillic_uppercase(name[0]):
             return False
-        if re.search(r'\d', name):
+        if _RE_DIGIT.search(name):
             return False
         # Check last word starts with uppercase
         last_word = words[-1]
@@ -75,38 +206,83 @@ class SobranieParser:
             if not self._is_cyrillic_uppercase(last_word_clean[0]):
                 return False
         # Check poison words (exact match using split)
-        name_words_lower = {w.lower() for w in name.split()}
-        for poison in self.POISON_WORDS:
-            if poison in name_words_lower:
-                self._stats["speakers_poisoned"] += 1
-                return False
+        if not self.POISON_WORDS.isdisjoint(w.lower() for w in words):
+            self._stats.speakers_poisoned += 1
+            return False
         return True
 
-    def _extract_words(self, page: Page) -> list[dict]:
-        """Extract words from a page, filtering out footer elements."""
-        all_words = page.extract_words(
-            keep_blank_chars=False,
-            x_tolerance=2,
-            y_tolerance=2
-        ) or []
+    def _count_pages(self, pdf_path: Path) -> int:
+        """Return the number of pages in a PDF."""
+        if pymupdf is not None and self.config.USE_PYMUPDF:
+            with pymupdf.open(str(pdf_path)) as doc:
+                return doc.page_count
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def _iter_page_words(
+            self,
+            pdf_path: Path,
+            first_page: int = 1,
+            last_page: Optional[int] = None
+    ) -> Iterator[tuple[int, float, float, list[dict]]]:
+        """
+        Extract words from a range of pages of a PDF.
+
+        Uses PyMuPDF when it is installed and enabled (much faster) and
+        falls back to pdfplumber otherwise. Both yield pdfplumber-style word dictionaries
+        with text, x0, x1, top and bottom keys.
+
+        Args:
+            pdf_path: Path to the PDF file
+            first_page: First page to extract (1-based)
+            last_page: Last page to extract, inclusive (default: last page of the PDF)
+
+        Yields:
+            Tuples of (page_num, page_width, page_height, words)
+        """
+        if pymupdf is not None and self.config.USE_PYMUPDF:
+            with pymupdf.open(str(pdf_path)) as doc:
+                last_page = min(last_page or doc.page_count, doc.page_count)
+                for page_num in range(first_page, last_page + 1):
+                    page = doc[page_num - 1]
+                    words = [
+                        {"text": text, "x0": x0, "x1": x1, "top": top, "bottom": bottom}
+                        for x0, top, x1, bottom, text, *_ in page.get_text("words")
+                    ]
+                    yield page_num, page.rect.width, page.rect.height, words
+        else:
+            with pdfplumber.open(pdf_path) as pdf:
+                for page_num, page in enumerate(pdf.pages[first_page - 1:last_page], first_page):
+                    words = _chars_to_words(page.chars, x_tolerance=2, y_tolerance=2)
+                    if words is None:
+                        words = page.extract_words(
+                            keep_blank_chars=False,
+                            x_tolerance=2,
+                            y_tolerance=2
+                        ) or []
+                    yield page_num, page.width, page.height, words
+                    # Release the page's cached layout objects, which pdfplumber
+                    # otherwise keeps until the whole document is closed
+                    page.close()
+
+    def _extract_words(self, all_words: list[dict], page_height: float) -> list[dict]:
+        """Filter footer elements out of a page's words and annotate each kept word with its center ("_cx")."""
         if not all_words:
             return []
-        page_height = page.height
         footer_boundary = page_height * (1 - self.config.FOOTER_ZONE_RATIO)
         content_words = []
         for word in all_words:
             word_bottom = word.get("bottom", word["top"])
             text = word["text"].strip()
-            if word_bottom >= footer_boundary:
-                if FooterCleaner.is_footer_code(text):
-                    self._stats["footer_codes_removed"] += 1
-                    continue
-                if FooterCleaner.is_page_number_at_bottom(text):
-                    self._stats["page_numbers_removed"] += 1
-                    continue
+            # Footer codes are dropped anywhere on the page, page numbers only in the footer zone
             if FooterCleaner.is_footer_code(text):
-                self._stats["footer_codes_removed"] += 1
+                self._stats.footer_codes_removed += 1
+                continue
+            if word_bottom >= footer_boundary and FooterCleaner.is_page_number_at_bottom(text):
+                self._stats.page_numbers_removed += 1
                 continue
+            # Horizontal center, computed once for column assignment
+            word["_cx"] = (word["x0"] + word["x1"]) / 2
             content_words.append(word)
         return content_words
 
@@ -119,11 +295,13 @@ class SobranieParser:
         left_words = []
         right_words = []
         margin = self.config.COLUMN_MARGIN
+        left_limit = gutter_center - margin
+        right_limit = gutter_center + margin
         for word in words:
-            word_center = (word["x0"] + word["x1"]) / 2
-            if word_center < gutter_center - margin:
+            word_center = word["_cx"]
+            if word_center < left_limit:
                 left_words.append(word)
-            elif word_center > gutter_center + margin:
+            elif word_center > right_limit:
                 right_words.append(word)
         return left_words, right_words
 
@@ -131,30 +309,34 @@ class SobranieParser:
         """Reconstruct text lines from word positions."""
         if not words:
             return []
-        sorted_words = sorted(words, key=lambda w: (w["top"], w["x0"]))
+        y_tolerance = self.config.Y_TOLERANCE
+        sorted_words = sorted(words, key=_BY_TOP_X0)
+        # Scan a flat list of tops instead of indexing a dict per word and
+        # cut the sorted words into line slices at each vertical jump
+        tops = [w["top"] for w in sorted_words]
         lines = []
-        current_line = [sorted_words[0]]
-        current_top = sorted_words[0]["top"]
-        for word in sorted_words[1:]:
-            if abs(word["top"] - current_top) <= self.config.Y_TOLERANCE:
-                current_line.append(word)
-            else:
-                current_line.sort(key=lambda w: w["x0"])
-                line_text = " ".join(w["text"] for w in current_line)
-                lines.append(line_text)
-                current_line = [word]
-                current_top = word["top"]
-        if current_line:
-            current_line.sort(key=lambda w: w["x0"])
-            lines.append(" ".join(w["text"] for w in current_line))
+        line_start = 0
+        current_top = tops[0]
+        for i, top in enumerate(tops):
+            if abs(top - current_top) > y_tolerance:
+                lines.append(self._join_line(sorted_words[line_start:i]))
+                line_start = i
+                current_top = top
+        lines.append(self._join_line(sorted_words[line_start:]))
         cleaned_lines = []
         for line in lines:
-            cleaned = re.sub(r"\s+", " ", line).strip()
+            cleaned = " ".join(line.split())
             cleaned = FooterCleaner.clean_text(cleaned)
             if cleaned:
                 cleaned_lines.append(cleaned)
         return cleaned_lines
 
+    @staticmethod
+    def _join_line(line_words: list[dict]) -> str:
+        """Join the words of one line from left to right."""
+        line_words.sort(key=_BY_X0)
+        return " ".join(w["text"] for w in line_words)
+
     def _try_extract_speaker(self, line: str) -> Optional[tuple[str, str]]:
         """Extract speaker from start of line."""
         if ":" not in line:
@@ -172,14 +354,7 @@ class SobranieParser:
 
         Returns: (text_before, speaker_name, text_after) or None
         """
-        pattern = re.compile(
-            r'([.?!])\s+'
-            r'([А-ЯЃЅЈЉЊЌЏа-яѓѕјљњќџ][А-ЯЃЅЈЉЊЌЏа-яѓѕјљњќџ\s\-\.]+?)'
-            r'\s*:\s*'
-            r'(.+)$'
-        )
-
-        match = pattern.search(line)
+        match = _RE_MID_LINE_SPEAKER.search(line)
         if match:
             full_match_start = match.start()
             speaker_candidate = match.group(2).strip()
@@ -193,31 +368,34 @@ class SobranieParser:
 
     def _clean_text(self, text: str) -> str:
         """Clean text by removing parenthetical content and footer patterns."""
-        cleaned = re.sub(r'\([^)]*\)', ' ', text)
-        cleaned = FooterCleaner.clean_text(cleaned)
-        return re.sub(r'\s+', ' ', cleaned).strip()
+        return FooterCleaner.clean_text(_RE_PARENTHESES_OR_SPACE.sub(' ', text))
 
     def _process_line(self, line: str, page_num: int, column: str) -> list[Speech]:
         """Process a line, handling both start and mid-line speakers."""
         completed_speeches = []
 
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped:
             return completed_speeches
-        if re.match(r'^[\s\.\,\-\_\(\)/]+$', line):
+        # Ordinary text lines start with a letter, so the first character
+        # decides whether the junk and footer patterns can match at all
+        first_char = stripped[0]
+        if first_char in _JUNK_LINE_CHARS and _RE_JUNK_LINE.match(line):
             return completed_speeches
-        if FooterCleaner.is_footer_code(line.strip()):
-            self._stats["footer_lines_removed"] += 1
+        if first_char.isdigit() and FooterCleaner.is_footer_code(stripped):
+            self._stats.footer_lines_removed += 1
             return completed_speeches
 
-        self._stats["lines_processed"] += 1
+        self._stats.lines_processed += 1
 
         # First, check for speaker at start of line
         result = self._try_extract_speaker(line)
 
         if result:
             speaker, rest = result
-            self._stats["speakers_found"] += 1
-            logger.debug(f"  [{column}] ✓ Speaker (start): '{speaker}'")
+            self._stats.speakers_found += 1
+            if self._debug:
+                logger.debug("  [%s] ✓ Speaker (start): '%s'", column, speaker)
 
             # Check if there's another speaker mid-line in the rest
             mid_line_result = self._try_extract_speaker_mid_line(rest)
@@ -233,8 +411,9 @@ class SobranieParser:
                 if previous and len(previous.raw_text) >= self.config.MIN_SPEECH_LENGTH:
                     completed_speeches.append(previous)
 
-                self._stats["speakers_found"] += 1
-                logger.debug(f"  [{column}] ✓ Speaker (mid): '{mid_speaker}'")
+                self._stats.speakers_found += 1
+                if self._debug:
+                    logger.debug("  [%s] ✓ Speaker (mid): '%s'", column, mid_speaker)
 
                 previous = self._buffer.start_new(
                     speaker=mid_speaker,
@@ -262,8 +441,9 @@ class SobranieParser:
                     if cleaned_before:
                         self._buffer.append(cleaned_before, page_num)
 
-                self._stats["speakers_found"] += 1
-                logger.debug(f"  [{column}] ✓ Speaker (mid): '{mid_speaker}'")
+                self._stats.speakers_found += 1
+                if self._debug:
+                    logger.debug("  [%s] ✓ Speaker (mid): '%s'", column, mid_speaker)
 
                 previous = self._buffer.start_new(
                     speaker=mid_speaker,
@@ -280,87 +460,183 @@ class SobranieParser:
 
         return completed_speeches
 
-    def _process_page(self, page: Page, page_num: int) -> list[Speech]:
-        """Process a single page."""
-        speeches = []
-        all_words = self._extract_words(page)
+    def _page_lines(
+            self,
+            words: list[dict],
+            page_width: float,
+            page_height: float,
+            page_num: int
+    ) -> Optional[tuple[list[str], list[str]]]:
+        """
+        Run the layout stage of a page: footer removal, gutter detection and line reconstruction.
+
+        Args:
+            words: Words extracted from the page
+            page_width: Width of the page
+            page_height: Height of the page
+            page_num: Page number
+
+        Returns:
+            Tuple of (left_lines, right_lines), or None if the page has no words
+        """
+        all_words = self._extract_words(words, page_height)
         if not all_words:
             logger.warning(f"Page {page_num}: No words extracted")
-            return speeches
-        self._stats["total_words"] += len(all_words)
-        gutter = self.detector.detect(all_words, page.width, page_num)
+            return None
+        self._stats.total_words += len(all_words)
+        gutter = self.detector.detect(all_words, page_width, page_num)
         if gutter and gutter.confidence > 0.3:
             gutter_center = gutter.center_x
-            logger.debug(f"Page {page_num}: Gutter at x={gutter_center:.1f}")
-            self._stats["pages_with_gutter"] += 1
+            if self._debug:
+                logger.debug("Page %d: Gutter at x=%.1f", page_num, gutter_center)
+            self._stats.pages_with_gutter += 1
         else:
-            gutter_center = page.width * self.config.FALLBACK_GUTTER_RATIO
-            logger.debug(f"Page {page_num}: Center gutter at {gutter_center:.1f}")
-            self._stats["pages_fallback"] += 1
+            gutter_center = page_width * self.config.FALLBACK_GUTTER_RATIO
+            if self._debug:
+                logger.debug("Page %d: Center gutter at %.1f", page_num, gutter_center)
+            self._stats.pages_fallback += 1
         left_words, right_words = self._split_into_columns(all_words, gutter_center)
-        self._stats["left_column_words"] += len(left_words)
-        self._stats["right_column_words"] += len(right_words)
+        self._stats.left_column_words += len(left_words)
+        self._stats.right_column_words += len(right_words)
+        return self._reconstruct_lines(left_words), self._reconstruct_lines(right_words)
+
+    def _iter_page_lines(
+            self,
+            pdf_path: Path,
+            page_count: int
+    ) -> Iterator[tuple[int, Optional[tuple[list[str], list[str]]]]]:
+        """
+        Yield the column lines of every page in page order.
+
+        The layout stage is independent per page, so on the pdfplumber path
+        large PDFs are split into page ranges handled by worker processes.
+        PyMuPDF is fast enough that starting workers costs more than it saves.
+        Speaker detection stays in this process because speeches continue
+        across pages.
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_count: Number of pages in the PDF
+
+        Yields:
+            Tuples of (page_num, (left_lines, right_lines) or None)
+        """
+        if pymupdf is not None and self.config.USE_PYMUPDF:
+            workers = 1
+        else:
+            workers = min(
+                self.config.PARSE_WORKERS,
+                os.cpu_count() or 1,
+                page_count // self.config.MIN_PAGES_PER_WORKER
+            )
+        if workers <= 1:
+            for page_num, page_width, page_height, words in self._iter_page_words(pdf_path):
+                yield page_num, self._page_lines(words, page_width, page_height, page_num)
+            return
+
+        pages_per_worker = -(-page_count // workers)
+        ranges = [
+            (first, min(first + pages_per_worker - 1, page_count))
+            for first in range(1, page_count + 1, pages_per_worker)
+        ]
+        logger.debug(f"Extracting {page_count} pages in {len(ranges)} worker processes")
+        # Spawn rather than fork: the bot parses from inside a thread pool
+        with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = executor.map(
+                _extract_page_lines,
+                [pdf_path] * len(ranges),
+                [first for first, _ in ranges],
+                [last for _, last in ranges],
+                [self.config] * len(ranges)
+            )
+            for pages, stats in results:
+                self._stats.merge(stats)
+                yield from pages
+
+    def _process_lines(self, page_num: int, left_lines: list[str], right_lines: list[str]) -> list[Speech]:
+        """Run speaker detection over the lines of a page, left column first."""
+        speeches = []
 
         # LEFT column
-        left_lines = self._reconstruct_lines(left_words)
         for line in left_lines:
             line_speeches = self._process_line(line, page_num, "L")
             speeches.extend(line_speeches)
 
         # RIGHT column
-        right_lines = self._reconstruct_lines(right_words)
         for line in right_lines:
             line_speeches = self._process_line(line, page_num, "R")
             speeches.extend(line_speeches)
 
-        self._stats["pages_processed"] += 1
+        self._stats.pages_processed += 1
         return speeches
 
-    def parse(self, pdf_path: str | Path) -> list[Speech]:
+    def iter_parse(self, pdf_path: str | Path) -> Iterator[Speech]:
         """
-        Parse a PDF file and extract speeches.
+        Parse a PDF file and yield speeches as soon as they are complete.
 
         Args:
             pdf_path: Path to the PDF file
 
-        Returns:
-            List of Speech objects
+        Yields:
+            Speech objects in document order
         """
         pdf_path = Path(pdf_path)
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
-        all_speeches = []
+        speech_count = 0
         self._buffer = TextBuffer()
-        self._stats = defaultdict(int)
+        self._stats = _Stats()
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         logger.info("=" * 70)
         logger.info(f"PARSING: {pdf_path.name}")
         logger.info("=" * 70)
-        with pdfplumber.open(pdf_path) as pdf:
-            logger.info(f"Total pages: {len(pdf.pages)}")
-            for page_num, page in enumerate(pdf.pages, 1):
-                speeches = self._process_page(page, page_num)
-                all_speeches.extend(speeches)
+        page_count = self._count_pages(pdf_path)
+        logger.info(f"Total pages: {page_count}")
+        for page_num, lines in self._iter_page_lines(pdf_path, page_count):
+            if lines is not None:
+                for speech in self._process_lines(page_num, *lines):
+                    speech_count += 1
+                    yield speech
         final = self._buffer.flush()
         if final and len(final.raw_text) >= self.config.MIN_SPEECH_LENGTH:
-            all_speeches.append(final)
-        self._print_summary(all_speeches)
-        return all_speeches
+            speech_count += 1
+            yield final
+        self._print_summary(speech_count)
+
+    def parse(self, pdf_path: str | Path) -> list[Speech]:
+        """
+        Parse a PDF file and extract speeches.
 
-    def _print_summary(self, speeches: list[Speech]) -> None:
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            List of Speech objects
+        """
+        return list(self.iter_parse(pdf_path))
+
+    def _print_summary(self, speech_count: int) -> None:
         """Print parsing summary."""
         logger.info("-" * 70)
         logger.info("PARSER SUMMARY")
         logger.info("-" * 70)
-        logger.info(f"Pages processed:       {self._stats['pages_processed']}")
-        logger.info(f"Total words:          {self._stats['total_words']}")
-        logger.info(f"Speakers found:       {self._stats['speakers_found']}")
-        logger.info(f"TOTAL SPEECHES:        {len(speeches)}")
+        logger.info(f"Pages processed:       {self._stats.pages_processed}")
+        logger.info(f"Total words:          {self._stats.total_words}")
+        logger.info(f"Speakers found:       {self._stats.speakers_found}")
+        logger.info(f"TOTAL SPEECHES:        {speech_count}")
         logger.info("-" * 70)
 
     def parse_to_jsonl(self, pdf_path: str | Path, output_path: str | Path) -> int:
         """
         Parse a PDF and save results to JSONL file.
 
+        Speeches are written as they are produced, so the whole document is
+        never held in memory. They go to a temp file next to output_path that
+        replaces it only once parsing succeeds, so an interrupted run never
+        leaves a partial file behind.
+
         Args:
             pdf_path: Path to the PDF file
             output_path: Path for the output JSONL file
@@ -368,11 +644,51 @@ class SobranieParser:
         Returns:
             Number of speeches extracted
         """
-        speeches = self.parse(pdf_path)
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            for speech in speeches:
-                f.write(speech.to_json() + "\n")
-        logger.info(f"Wrote {len(speeches)} speeches to {output_path}")
-        return len(speeches)
\ No newline at end of file
+        speech_count = 0
+        with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=output_path.parent, suffix=".tmp", delete=False
+        ) as f:
+            temp_path = Path(f.name)
+            try:
+                for speech in self.iter_parse(pdf_path):
+                    f.write(speech.to_json())
+                    f.write("\n")
+                    speech_count += 1
+            except BaseException:
+                f.close()
+                temp_path.unlink()
+                raise
+        # NamedTemporaryFile creates 0600 files; keep the usual mode
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, output_path)
+        logger.info(f"Wrote {speech_count} speeches to {output_path}")
+        return speech_count
+
+
+def _extract_page_lines(
+        pdf_path: Path,
+        first_page: int,
+        last_page: int,
+        config: ParserConfig
+) -> tuple[list[tuple[int, Optional[tuple[list[str], list[str]]]]], _Stats]:
+    """
+    Run the layout stage for a range of pages in a worker process.
+
+    Args:
+        pdf_path: Path to the PDF file
+        first_page: First page of the range (1-based)
+        last_page: Last page of the range, inclusive
+        config: Parser configuration
+
+    Returns:
+        Tuple of (per-page results, statistics collected by the worker)
+    """
+    parser = SobranieParser(config)
+    pages = [
+        (page_num, parser._page_lines(words, page_width, page_height, page_num))
+        for page_num, page_width, page_height, words
+        in parser._iter_page_words(pdf_path, first_page, last_page)
+    ]
+    return pages, parser._stats
@@ -4,6 +4,7 @@ Layout detection for two-column PDF parsing.
 
 from __future__ import annotations
 
+from itertools import accumulate
 from typing import Optional
 
 from ..models import GutterInfo
@@ -44,24 +45,30 @@ class VerticalProjectionDetector:
 
         resolution = self.config.DENSITY_MAP_RESOLUTION
         num_bins = int(page_width / resolution) + 1
-        density = [0] * num_bins
+        last_bin = num_bins - 1
 
+        # Difference array: +1 where a word starts, -1 just past where it ends.
+        # A running sum then gives the number of words covering each bin.
+        diff = [0] * (num_bins + 1)
         for word in words:
-            start_bin = max(0, min(int(word["x0"] / resolution), num_bins - 1))
-            end_bin = max(0, min(int(word["x1"] / resolution), num_bins - 1))
-            for b in range(start_bin, end_bin + 1):
-                density[b] += 1
+            start_bin = max(0, min(int(word["x0"] / resolution), last_bin))
+            end_bin = max(0, min(int(word["x1"] / resolution), last_bin))
+            if start_bin <= end_bin:
+                diff[start_bin] += 1
+                diff[end_bin + 1] -= 1
+        density = list(accumulate(diff[:-1]))
 
         search_start = int((page_width * self.config.GUTTER_SEARCH_START) / resolution)
         search_end = int((page_width * self.config.GUTTER_SEARCH_END) / resolution)
         search_start = max(0, search_start)
         search_end = min(len(density) - 1, search_end)
 
+        threshold = self.config.DENSITY_THRESHOLD
         valleys = []
         valley_start = None
 
         for i in range(search_start, search_end + 1):
-            if density[i] <= self.config.DENSITY_THRESHOLD:
+            if density[i] <= threshold:
                 if valley_start is None:
                     valley_start = i
             else:
@@ -5,7 +5,12 @@ History management for Sobranie Bot.
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 from datetime import datetime
 
 from .utils import get_logger
@@ -13,6 +18,35 @@ from .utils import get_logger
 logger = get_logger()
 
 
+def _atomic_write_json(path: Path, data: dict, compact: bool = False) -> None:
+    """
+    Write JSON to a temp file next to path, then replace path with it.
+
+    Args:
+        path: Destination file
+        data: Data to serialize
+        compact: Write without indentation or spaces (for machine-only files
+            that are rewritten often)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+    ) as f:
+        temp_path = Path(f.name)
+        try:
+            if compact:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            else:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except Exception:
+            f.close()
+            temp_path.unlink()
+            raise
+    # NamedTemporaryFile creates 0600 files; keep the usual mode
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, path)
+
+
 class HistoryManager:
     """Manages the history of processed sessions."""
 
@@ -25,6 +59,10 @@ class HistoryManager:
         """
         self.history_file = history_file
         self._history: dict = self._load()
+        # Processed sessions indexed by sitting_id, kept in memory for O(1) lookups
+        self._processed: dict = self._history.setdefault("processed_sessions", {})
+        self._lock = threading.Lock()
+        self._dirty = False
 
     def _load(self) -> dict:
         """Load history from file."""
@@ -38,10 +76,8 @@ class HistoryManager:
         return {"processed_sessions": {}}
 
     def _save(self) -> None:
-        """Save history to file."""
-        self.history_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.history_file, "w", encoding="utf-8") as f:
-            json.dump(self._history, f, ensure_ascii=False, indent=2)
+        """Save history to file atomically (indented, as it is meant to be read)."""
+        _atomic_write_json(self.history_file, self._history)
 
     def is_processed(self, sitting_id: str) -> bool:
         """
@@ -53,23 +89,41 @@ class HistoryManager:
         Returns:
             True if already processed, False otherwise
         """
-        return sitting_id in self._history.get("processed_sessions", {})
+        return sitting_id in self._processed
 
     def mark_processed(self, sitting_id: str, metadata: dict) -> None:
         """
-        Mark a session as processed.
+        Mark a session as processed and save history immediately.
 
         Args:
             sitting_id: The session ID
             metadata: Additional metadata to store
         """
-        if "processed_sessions" not in self._history:
-            self._history["processed_sessions"] = {}
-        self._history["processed_sessions"][sitting_id] = {
-            "processed_at": datetime.now().isoformat(),
-            **metadata
-        }
-        self._save()
+        self.mark_processed_deferred(sitting_id, metadata)
+        self.flush()
+
+    def mark_processed_deferred(self, sitting_id: str, metadata: dict) -> None:
+        """
+        Mark a session as processed in memory only (persisted by flush()).
+
+        Args:
+            sitting_id: The session ID
+            metadata: Additional metadata to store
+        """
+        with self._lock:
+            self._processed[sitting_id] = {
+                "processed_at": datetime.now().isoformat(),
+                **metadata
+            }
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending changes to the history file."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._save()
+            self._dirty = False
 
     def get_stats(self) -> dict:
         """
@@ -79,5 +133,118 @@ class HistoryManager:
             Dictionary with statistics
         """
         return {
-            "total_processed": len(self._history.get("processed_sessions", {}))
-        }
\ No newline at end of file
+            "total_processed": len(self._processed)
+        }
+
+
+class DetailsCache:
+    """On-disk cache of stenograph document lists, keyed by details page URL."""
+
+    def __init__(self, cache_file: Path, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_file: Path to the cache JSON file
+            ttl: Time-to-live of cache entries in seconds
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._entries: dict = self._load()
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        """Load cache entries from file."""
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load details cache: {e}")
+        return {}
+
+    def get(self, details_url: str) -> Optional[list[tuple[str, dict]]]:
+        """
+        Get cached documents for a details page.
+
+        Args:
+            details_url: URL of the session details page
+
+        Returns:
+            List of (download_url, parsed_info_dict) tuples, or None if
+            missing or expired
+        """
+        entry = self._entries.get(details_url)
+        if not entry or time.time() - entry["fetched_at"] > self.ttl:
+            return None
+        return [(url, info) for url, info in entry["files"]]
+
+    def clear(self) -> None:
+        """Remove all cache entries and save the cache."""
+        with self._lock:
+            self._entries = {}
+            _atomic_write_json(self.cache_file, self._entries, compact=True)
+
+    def put(self, details_url: str, found_files: list[tuple[str, dict]]) -> None:
+        """
+        Store documents for a details page and save the cache.
+
+        Args:
+            details_url: URL of the session details page
+            found_files: List of (download_url, parsed_info_dict) tuples
+        """
+        with self._lock:
+            self._entries[details_url] = {
+                "fetched_at": time.time(),
+                "files": [[url, info] for url, info in found_files]
+            }
+            _atomic_write_json(self.cache_file, self._entries, compact=True)
+
+
+class DownloadManifest:
+    """Records validators (ETag, Last-Modified, size) of downloaded files by URL."""
+
+    def __init__(self, manifest_file: Path):
+        """
+        Initialize the manifest.
+
+        Args:
+            manifest_file: Path to the manifest JSON file
+        """
+        self.manifest_file = manifest_file
+        self._entries: dict = self._load()
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        """Load manifest entries from file."""
+        if self.manifest_file.exists():
+            try:
+                with open(self.manifest_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load download manifest: {e}")
+        return {}
+
+    def get(self, url: str) -> Optional[dict]:
+        """
+        Get the recorded download for a URL.
+
+        Args:
+            url: Download URL
+
+        Returns:
+            Dictionary with filename, size, etag and last_modified, or None
+        """
+        return self._entries.get(url)
+
+    def record(self, url: str, entry: dict) -> None:
+        """
+        Record a completed download and save the manifest.
+
+        Args:
+            url: Download URL
+            entry: Dictionary with filename, size, etag and last_modified
+        """
+        with self._lock:
+            self._entries[url] = entry
+            _atomic_write_json(self.manifest_file, self._entries, compact=True)
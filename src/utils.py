@@ -6,12 +6,20 @@ from __future__ import annotations
 
 import re
 import logging
+from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 # Global logger instance (singleton pattern)
 _logger: Optional[logging.Logger] = None
 
+# Link text patterns, compiled once
+_RE_DATE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+_RE_SESSION_NUMBER = re.compile(r'(\d{1,3})[^\d]*?седница', re.IGNORECASE)
+_RE_SESSION_NUMBER_AFTER = re.compile(r'седница\s*(\d{1,3})', re.IGNORECASE)
+_RE_CONTINUATION = re.compile(r'(\d{1,2})[^\d]*?продолжение', re.IGNORECASE)
+_RE_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-]')
+
 
 def setup_logger(
         name: str = "sobranie_bot",
@@ -89,7 +97,7 @@ def parse_pdf_link_text(link_text: str) -> Optional[dict]:
     """
     try:
         # 1. Date (Format: DD.MM.YYYY)
-        date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', link_text)
+        date_match = _RE_DATE.search(link_text)
         if not date_match:
             return None
 
@@ -99,11 +107,11 @@ def parse_pdf_link_text(link_text: str) -> Optional[dict]:
         date_formatted = f"{year}-{month}-{day}"
 
         # 2. Session number (FIXED: Ignores -та, -ва, -ма suffixes)
-        session_match = re.search(r'(\d{1,3})[^\d]*?седница', link_text, re.IGNORECASE)
+        session_match = _RE_SESSION_NUMBER.search(link_text)
 
         if not session_match:
             # Fallback: If written as "седница бр. 75"
-            session_match = re.search(r'седница\s*(\d{1,3})', link_text, re.IGNORECASE)
+            session_match = _RE_SESSION_NUMBER_AFTER.search(link_text)
 
         if not session_match:
             return None
@@ -113,7 +121,7 @@ def parse_pdf_link_text(link_text: str) -> Optional[dict]:
         # 3. Continuation
         continuation = "00"
         if "продолжение" in link_text.lower():
-            cont_match = re.search(r'(\d{1,2})[^\d]*?продолжение', link_text, re.IGNORECASE)
+            cont_match = _RE_CONTINUATION.search(link_text)
             continuation = cont_match.group(1).zfill(2) if cont_match else "01"
 
         # 4. Form clean filename - extension will be determined at download time
@@ -147,7 +155,7 @@ def generate_fallback_filename(
         Dictionary with filename info
     """
     ext = '.doc' if '.doc' in url.lower() else '.pdf'
-    safe_title = re.sub(r'[^\w\-]', '_', title)[:50]
+    safe_title = _RE_UNSAFE_FILENAME_CHARS.sub('_', title)[:50]
 
     return {
         'filename': f"stenogram_{doc_id}_{safe_title}{ext}",
@@ -155,4 +163,21 @@ def generate_fallback_filename(
         'session_num': '000',
         'continuation': '00',
         'date': datetime.now().strftime('%Y-%m-%d')
-    }
\ No newline at end of file
+    }
+
+
+def count_lines(path: Path) -> int:
+    """
+    Count lines in a file without decoding it.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Number of newline-terminated lines
+    """
+    count = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            count += block.count(b"\n")
+    return count
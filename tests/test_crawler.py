@@ -0,0 +1,43 @@
+"""
+Tests for the crawler's HTML session row selection.
+"""
+
+import re
+import unittest
+
+from lxml import html as lxml_html
+
+from src.crawler import _XPATH_SESSION_ROWS
+
+FIXTURE_HTML = """
+<html><body>
+  <table>
+    <tr class="ng-scope"><td>Завршена</td></tr>
+    <tr class="row"><td>Затворена</td></tr>
+    <tr class="header"><td>Статус</td></tr>
+  </table>
+  <div class="row"><a href="/detali-na-sednica.nspx?sittingId=1">1</a></div>
+  <div class="ng-scope ng-isolate-scope">Завршена</div>
+  <div class="session-row">Затворена</div>
+  <div class="container"><span class="row">not a div or tr</span></div>
+  <div>no class</div>
+</body></html>
+"""
+
+
+def _baseline_rows(tree):
+    """Row selection before the XPath: any div/tr whose class contains row or ng-scope."""
+    row_class = re.compile(r'row|ng-scope')
+    return [e for e in tree.iter('div', 'tr') if row_class.search(e.get('class', ''))]
+
+
+class SessionRowsTest(unittest.TestCase):
+    def test_matches_baseline_selection(self):
+        tree = lxml_html.fromstring(FIXTURE_HTML)
+        rows = _XPATH_SESSION_ROWS(tree)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows, _baseline_rows(tree))
+
+
+if __name__ == "__main__":
+    unittest.main()